@@ -8,14 +8,21 @@ to the first column after the tree.
 
 Dependencies:
   - biopython (recommended): pip install biopython
+  - numba (optional): pip install numba
+    JIT-compiles the grid rasterizer for very large trees (see JIT_MIN_NODES).
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
+import os
 import sys
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import tempfile
+import time
+from array import array
+from typing import BinaryIO, Callable, Iterator, List, Optional, Sequence, Set, Tuple
 
 try:
     from Bio import Phylo
@@ -29,249 +36,376 @@ except ImportError as e:
 # Layout data structures
 # ----------------------------
 
-@dataclass(frozen=True)
-class NodeInfo:
-    depth: int
-    y: int  # row index
+class FlatTree:
+    """
+    A tree flattened into parallel arrays indexed by node. Nodes are numbered
+    in pre-order, so every parent comes before its children and leaves come in
+    row order. Children are a linked list: first_child[i], then next_sib[k].
+    """
+    __slots__ = ("first_child", "next_sib", "depth", "y", "max_depth", "n_rows")
+
+    def __init__(self, first_child: array, next_sib: array, depth: array, y: array,
+                 max_depth: int, n_rows: int):
+        self.first_child = first_child  # -1 for leaves
+        self.next_sib = next_sib  # -1 for the last child
+        self.depth = depth
+        self.y = y  # row index
+        self.max_depth = max_depth
+        self.n_rows = n_rows  # one row per leaf
+
+
+# The render grid stores one small integer code per cell (one byte each in a
+# bytearray row); codes are mapped to box-drawing glyphs only when serializing.
+(SPACE, VERT, HORIZ, TOP, BOTTOM, TEE, CROSS,
+ LEFT_TEE, DOWN_TEE, UP_TEE) = range(10)
+GLYPHS = (" ", "│", "─", "┌", "└", "├", "┼", "┤", "┬", "┴")
+GLYPH_BYTES = tuple(g.encode("utf-8") for g in GLYPHS)
+_HORIZ_BYTE = bytes((HORIZ,))
+
+# Strongest junctions win when two glyphs land on the same cell.
+_STRENGTH = (0, 1, 1, 2, 2, 2, 4, 2, 3, 3)
+
+# Glyph to use instead when there is a horizontal stroke immediately to the left.
+_WITH_LEFT = {
+    VERT: LEFT_TEE,   # left + vertical (no implied right branch)
+    TOP: DOWN_TEE,    # left + right + down (top tee)
+    BOTTOM: UP_TEE,   # left + right + up (bottom tee)
+    TEE: CROSS,       # because ├ already implies a right branch; with left, it's a cross
+}
+
+
+def _merge_glyphs(left_is_horiz: bool, existing: int, ch: int) -> int:
+    """
+    Return the code a cell holding `existing` ends up with when `ch` is drawn
+    onto it. Only used to build MERGE_TABLE at import time.
+    """
+    # If there's a horizontal stroke immediately to the left, prefer glyphs that
+    # explicitly include a left-connection.
+    if left_is_horiz:
+        ch = _WITH_LEFT.get(ch, ch)
+
+    if existing == SPACE:
+        return ch
+
+    if _STRENGTH[ch] > _STRENGTH[existing]:
+        existing = ch
+
+    # Merge rules at the same cell (true crossings/tees)
+    # If both horizontal and vertical are present, it's a real cross.
+    if (existing == HORIZ and ch in (VERT, LEFT_TEE)) or (existing in (VERT, LEFT_TEE) and ch == HORIZ):
+        return CROSS
+
+    # If we have ┤ and later we add │ (or vice versa), keep ┤
+    if (existing == VERT and ch == LEFT_TEE) or (existing == LEFT_TEE and ch == VERT):
+        return LEFT_TEE
+
+    # If we have ┬/┴ and later add vertical through, upgrade to ┼
+    if existing in (DOWN_TEE, UP_TEE) and ch == VERT:
+        return CROSS
+
+    return existing
+
+
+# All merge decisions, evaluated once at import: the resulting cell code is
+# MERGE_TABLE[(left_is_horiz * N_GLYPHS + existing) * N_GLYPHS + ch].
+N_GLYPHS = len(GLYPHS)
+MERGE_TABLE = bytes(
+    _merge_glyphs(left, existing, ch)
+    for left in (False, True)
+    for existing in range(N_GLYPHS)
+    for ch in range(N_GLYPHS)
+)
 
 
 # ----------------------------
 # Tree utilities
 # ----------------------------
 
-def _is_leaf(clade) -> bool:
-    return not getattr(clade, "clades", None)
-
-
 def _label_for_leaf(clade) -> str:
     # Biopython stores names in clade.name (may be None)
     return str(clade.name) if clade.name is not None else ""
 
 
-def _collapse_unary(clade):
+def _skip_unary_chain(clade):
     """
-    Collapse chains of unary internal nodes so depth is not inflated
-    by nodes with exactly one child. This reduces horizontal width.
+    Follow a chain of unary internal nodes down to the first node that is
+    either a leaf or has two or more children.
     """
-    while getattr(clade, "clades", None) and len(clade.clades) == 1:
-        child = clade.clades[0]
+    kids = getattr(clade, "clades", None)
+    while kids and len(kids) == 1:
+        child = kids[0]
         # Merge: carry name if parent has one and child doesn't
         if getattr(clade, "name", None) and not getattr(child, "name", None):
             child.name = clade.name
         clade = child
-    if getattr(clade, "clades", None):
-        newkids = []
-        for k in clade.clades:
-            newkids.append(_collapse_unary(k))
-        clade.clades = newkids
+        kids = getattr(clade, "clades", None)
+    return clade
+
+
+def _collapse_unary(clade, collapsed: Optional[Set[int]] = None):
+    """
+    Collapse chains of unary internal nodes so depth is not inflated
+    by nodes with exactly one child. This reduces horizontal width.
+
+    Iterative (explicit stack), so very deep trees cannot hit the
+    interpreter's recursion limit.
+
+    If `collapsed` is given, it holds id()s of clades whose subtrees are
+    already collapsed: those are not walked again, and every clade walked
+    now is added to it.
+    """
+    clade = _skip_unary_chain(clade)
+    stack = [clade]
+    while stack:
+        node = stack.pop()
+        if collapsed is not None:
+            if id(node) in collapsed:
+                continue
+            collapsed.add(id(node))
+        kids = getattr(node, "clades", None)
+        if kids:
+            # Patch the child list in place; usually no child is unary, so
+            # nothing is written and no new list is allocated.
+            for j, k in enumerate(kids):
+                top = _skip_unary_chain(k)
+                if top is not k:
+                    kids[j] = top
+            stack.extend(kids)
     return clade
 
 
-def _assign_rows_and_depths(root) -> Tuple[Dict[int, NodeInfo], List[Tuple[int, str]]]:
+def _assign_rows_and_depths(root) -> Tuple[FlatTree, List[Tuple[int, str]]]:
     """
-    Assign each clade a (depth, y) where leaves occupy consecutive rows.
+    Flatten the clade tree into a FlatTree and assign each node a (depth, y)
+    in the same walk, where leaves occupy consecutive rows.
     Internal nodes get y as the midpoint of their children's rows.
 
     Returns:
-      node_map: dict mapping id(clade) -> NodeInfo
+      tree: the FlatTree, so later passes iterate integer arrays instead of
+            chasing clade objects; also carries max_depth and n_rows
       leaves: list of (leaf_y, leaf_label) in row order
     """
-    node_map: Dict[int, NodeInfo] = {}
+    first_child = array("i")
+    next_sib = array("i")
+    depth = array("i")
+    y = array("i")
     leaves: List[Tuple[int, str]] = []
-    next_y = 0
-
-    def walk(clade, depth: int) -> int:
-        nonlocal next_y
-        if _is_leaf(clade):
-            y = next_y
-            next_y += 1
-            node_map[id(clade)] = NodeInfo(depth=depth, y=y)
-            leaves.append((y, _label_for_leaf(clade)))
-            return y
-
-        child_ys = [walk(ch, depth + 1) for ch in clade.clades]
-        y = (min(child_ys) + max(child_ys)) // 2
-        node_map[id(clade)] = NodeInfo(depth=depth, y=y)
-        return y
-
-    walk(root, 0)
-    return node_map, leaves
+    last_child: List[int] = []
+    max_depth = 0
+
+    # Depth-first walk with an explicit stack of (clade, parent index, depth).
+    # Nodes are numbered on entry (pre-order); an internal node also pushes an
+    # exit entry (None, its index, depth), popped once its children are placed.
+    stack = [(root, -1, 0)]
+    while stack:
+        clade, par, d = stack.pop()
+        if clade is None:
+            k = first_child[par]
+            y_min = y_max = y[k]
+            k = next_sib[k]
+            while k >= 0:
+                y_min = min(y_min, y[k])
+                y_max = max(y_max, y[k])
+                k = next_sib[k]
+            y[par] = (y_min + y_max) // 2
+            continue
+
+        i = len(first_child)
+        first_child.append(-1)
+        next_sib.append(-1)
+        depth.append(d)
+        last_child.append(-1)
+        if par >= 0:
+            # Siblings are visited left to right, so append to the parent's list.
+            if last_child[par] < 0:
+                first_child[par] = i
+            else:
+                next_sib[last_child[par]] = i
+            last_child[par] = i
+
+        kids = getattr(clade, "clades", None)
+        if not kids:
+            y.append(len(leaves))
+            leaves.append((len(leaves), _label_for_leaf(clade)))
+            # The deepest node is always a leaf.
+            if d > max_depth:
+                max_depth = d
+        else:
+            y.append(0)
+            stack.append((None, i, d))
+            # Reversed, so children are numbered (and get rows) left to right.
+            for ch in reversed(kids):
+                stack.append((ch, i, d + 1))
+
+    return FlatTree(first_child, next_sib, depth, y, max_depth, len(leaves)), leaves
 
 
 # ----------------------------
 # Rendering
 # ----------------------------
-def render_box_tree(root, node_map: Dict[int, NodeInfo], leaves: List[Tuple[int, str]]) -> str:
+def _rasterize(first_child, next_sib, depth, node_y, grid, merge_table, leaf_last_x) -> None:
     """
-    Render with 2 columns per depth:
-      node_x = depth * 2
-      connector column = node_x + 1 (junctions + vertical)
+    Draw every internal node's spine and child connectors into `grid`, and
+    record in `leaf_last_x` the column where each leaf row's line ends.
 
-    Improvements vs prior version:
-      - Uses ┌ for the top child junction row, └ for the bottom, ├ for middle.
-      - Extends each leaf's horizontal line all the way to the leaf label.
+    Plain integer loops over the FlatTree arrays, so the same code runs as
+    Python (array.array columns, bytearray rows) or, when numba is available,
+    JIT-compiled (NumPy arrays). Only in-bounds columns >= 1 are written.
     """
-    if not leaves:
-        return ""
-
-    n_rows = max(y for y, _ in leaves) + 1
-    max_depth = max(info.depth for info in node_map.values())
-    tree_width = max_depth * 2  # last depth node_x
-    label_start = tree_width + 2  # first column where label text begins
-    label_col = label_start  # grid width up to (but not including) labels; labels appended later
-
-    grid: List[List[str]] = [[" " for _ in range(label_col)] for _ in range(n_rows)]
-
-    def put(y: int, x: int, ch: str):
-        if not (0 <= y < n_rows and 0 <= x < len(grid[y])):
-            return
-
-        left = grid[y][x - 1] if x > 0 else None
-        existing = grid[y][x]
-
-        # If there's a horizontal stroke immediately to the left, prefer glyphs that
-        # explicitly include a left-connection.
-        if left == "─":
-            if ch == "│":
-                ch = "┤"   # left + vertical (no implied right branch)
-            elif ch == "┌":
-                ch = "┬"   # left + right + down (top tee)
-            elif ch == "└":
-                ch = "┴"   # left + right + up (bottom tee)
-            elif ch == "├":
-                ch = "┼"   # because ├ already implies a right branch; with left, it's a cross
-
-        if existing == " ":
-            grid[y][x] = ch
-            return
-
-        # Strongest junctions win
-        strength = {" ": 0, "─": 1, "│": 1, "┤": 2, "┌": 2, "└": 2, "├": 2, "┬": 3, "┴": 3, "┼": 4}
-        if strength.get(ch, 0) > strength.get(existing, 0):
-            grid[y][x] = ch
-            existing = ch
-
-        # Merge rules at the same cell (true crossings/tees)
-        # If both horizontal and vertical are present, we need at least ┤, and possibly ┼.
-        if (existing == "─" and ch in {"│", "┤"}) or (existing in {"│", "┤"} and ch == "─"):
-            # If we already have left-joining vertical, adding horizontal implies both-sides horizontal
-            # at that coordinate (i.e. a real cross).
-            if existing == "┤" or ch == "┤":
-                grid[y][x] = "┼"
-            else:
-                # plain vertical + horizontal at same cell: cross
-                grid[y][x] = "┼"
-            return
-
-        # If we have ┤ and later we add │ (or vice versa), keep ┤
-        if {existing, ch} == {"│", "┤"}:
-            grid[y][x] = "┤"
-            return
-
-        # If we have ┬/┴ and later add vertical through, upgrade to ┼
-        if existing in {"┬", "┴"} and ch == "│":
-            grid[y][x] = "┼"
-            return
-
-
-#     def put(y: int, x: int, ch: str):
-        # if 0 <= y < n_rows and 0 <= x < len(grid[y]):
-            # existing = grid[y][x]
-            # if existing == " ":
-                # grid[y][x] = ch
-                # return
-
-            # # Preserve junction/corner glyphs over plain strokes.
-            # if existing in {"┌", "└", "├", "┼"}:
-                # return
-            # if ch in {"┌", "└", "├", "┼"}:
-                # grid[y][x] = ch
-                # return
-
-            # # Merge crossings of vertical/horizontal.
-            # merges = {
-                # frozenset({"│", "─"}): "┼",
-                # frozenset({"│", "┼"}): "┼",
-                # frozenset({"─", "┼"}): "┼",
-            # }
-            # merged = merges.get(frozenset({existing, ch}))
-            # if merged:
-                # grid[y][x] = merged
-            # # else: keep existing
+    # Nodes are numbered in pre-order, so each internal node draws its spine
+    # and child connectors before any of its descendants are drawn.
+    for i in range(len(first_child)):
+        if first_child[i] < 0:
+            continue
 
-    def draw_internal(clade):
-        info = node_map[id(clade)]
-        if _is_leaf(clade):
-            return
+        x_conn = depth[i] * 2 + 1
 
-        x_node = info.depth * 2
-        x_conn = x_node + 1
-
-        kids = clade.clades
-        kid_infos = [node_map[id(k)] for k in kids]
-        ys = [ki.y for ki in kid_infos]
-        y_top, y_bottom = min(ys), max(ys)
+        y_top = y_bottom = node_y[first_child[i]]
+        k = next_sib[first_child[i]]
+        while k >= 0:
+            y_top = min(y_top, node_y[k])
+            y_bottom = max(y_bottom, node_y[k])
+            k = next_sib[k]
 
         # Draw vertical spine only between top and bottom (exclusive),
         # so endpoints can be proper corners.
         for y in range(y_top + 1, y_bottom):
-            put(y, x_conn, "│")
+            row = grid[y]
+            left = 1 if row[x_conn - 1] == HORIZ else 0
+            row[x_conn] = merge_table[(left * N_GLYPHS + row[x_conn]) * N_GLYPHS + VERT]
 
         # Connect each child
-        for kid, ki in zip(kids, kid_infos):
-            y = ki.y
-
+        k = first_child[i]
+        while k >= 0:
+            y = node_y[k]
             if y == y_top and y != y_bottom:
-                jch = "┌"
+                jch = TOP
             elif y == y_bottom and y != y_top:
-                jch = "└"
+                jch = BOTTOM
             else:
                 # If all children are on same row (degenerate), fall back to ├
                 # otherwise middle children get ├.
-                jch = "├" if y_top != y_bottom else "├"
+                jch = TEE
 
-            put(y, x_conn, jch)
+            row = grid[y]
+            left = 1 if row[x_conn - 1] == HORIZ else 0
+            row[x_conn] = merge_table[(left * N_GLYPHS + row[x_conn]) * N_GLYPHS + jch]
 
             # Horizontal run from just right of the junction to the child's node column.
-            x_child = ki.depth * 2
+            x_child = depth[k] * 2
             for x in range(x_conn + 1, x_child + 1):
-                put(y, x, "─")
+                left = 1 if row[x - 1] == HORIZ else 0
+                row[x] = merge_table[(left * N_GLYPHS + row[x]) * N_GLYPHS + HORIZ]
+            if first_child[k] < 0:
+                leaf_last_x[y] = x_child
+
+            k = next_sib[k]
+
+
+# Importing numpy/numba and loading the compiled _rasterize from numba's cache
+# costs ~0.3 s per process, and the JIT saves only ~1-1.5 us per node (down to
+# ~0.7 on deep caterpillars, whose mostly blank grids are costly to copy back
+# from NumPy), so it is only used for trees of at least this many nodes.
+# newick2box_bench.py divides that overhead by the smallest per-node saving it
+# sees; across runs that put break-even between ~300k and ~1.8M nodes. Rerun it
+# to re-derive the value.
+JIT_MIN_NODES = 1_000_000
+
+_jit = None  # None: not loaded yet; False: numba unavailable; else (np, func, table)
+
+
+def _load_rasterize_jit():
+    """
+    Import numpy and numba on first use and return (np, jitted _rasterize,
+    MERGE_TABLE as a uint8 array), or None if numba isn't installed.
+    """
+    global _jit
+    if _jit is None:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:
+            _jit = False
+        else:
+            from numba.core import config
+
+            # numba's cache entries record the name of the module that compiled
+            # the function, so entries written while this file is imported as a
+            # module can't be loaded when it runs as a script (__main__), and
+            # vice versa. Keep a separate cache per module name; numba fixes a
+            # function's cache location when it is decorated.
+            user_cache_dir = config.CACHE_DIR
+            config.CACHE_DIR = os.path.join(user_cache_dir or os.path.join(_cache_dir(), "numba"), __name__)
+            try:
+                rasterize_jit = njit(cache=True)(_rasterize)
+            finally:
+                config.CACHE_DIR = user_cache_dir
+            _jit = (np, rasterize_jit, np.frombuffer(MERGE_TABLE, dtype=np.uint8))
+    return _jit or None
+
+
+def _rasterize_grid(tree: FlatTree, label_col: int, use_jit: bool) -> Tuple[List[bytearray], Sequence[int]]:
+    """
+    Rasterize `tree` into one bytearray of glyph codes per row, label_col wide,
+    and return it with each row's leaf_last_x (see _rasterize). Uses the
+    numba-compiled rasterizer if `use_jit` and numba is installed.
+    """
+    n_rows = tree.n_rows
+    # Every row holds exactly one leaf; a leaf root has no parent connector,
+    # so its line starts at column 0.
+    jit = _load_rasterize_jit() if use_jit else None
+    if jit is None:
+        grid = [bytearray(label_col) for _ in range(n_rows)]
+        leaf_last_x = array("i", [-1]) * n_rows
+        _rasterize(tree.first_child, tree.next_sib, tree.depth, tree.y, grid, MERGE_TABLE, leaf_last_x)
+        return grid, leaf_last_x
+
+    np, rasterize_jit, merge_table = jit
+    np_grid = np.zeros((n_rows, label_col), dtype=np.uint8)
+    np_last = np.full(n_rows, -1, dtype=np.intc)
+    rasterize_jit(
+        np.frombuffer(tree.first_child, dtype=np.intc),
+        np.frombuffer(tree.next_sib, dtype=np.intc),
+        np.frombuffer(tree.depth, dtype=np.intc),
+        np.frombuffer(tree.y, dtype=np.intc),
+        np_grid, merge_table, np_last,
+    )
+    return [bytearray(row) for row in np_grid], np_last.tolist()
+
+
+def render_box_tree(tree: FlatTree, leaves: List[Tuple[int, str]]) -> Iterator[bytes]:
+    """
+    Yield the rendering one row at a time, as UTF-8 bytes without a newline.
+
+    Render with 2 columns per depth:
+      node_x = depth * 2
+      connector column = node_x + 1 (junctions + vertical)
+
+    Improvements vs prior version:
+      - Uses ┌ for the top child junction row, └ for the bottom, ├ for middle.
+      - Extends each leaf's horizontal line all the way to the leaf label.
+    """
+    if not leaves:
+        return
 
-            draw_internal(kid)
+    max_depth = tree.max_depth
+    tree_width = max_depth * 2  # last depth node_x
+    label_start = tree_width + 2  # first column where label text begins
+    label_col = label_start  # grid width up to (but not including) labels; labels appended later
 
-    draw_internal(root)
+    grid, leaf_last_x = _rasterize_grid(tree, label_col, len(tree.first_child) >= JIT_MIN_NODES)
 
     # Extend horizontal lines for leaves all the way to the label column (right up to label_start-1).
-    # We do this BEFORE writing labels.
-    leaf_rows = {y for y, _ in leaves}
-    for y in leaf_rows:
-        row = grid[y]
-        # Find last non-space char in the tree region (0 .. label_start-1).
-        last = -1
-        for x in range(len(row) - 1, -1, -1):
-            if row[x] != " ":
-                last = x
-                break
-        # Fill from last+1 up to label_start-1 with ─ (if there is any gap).
-        for x in range(last + 1, label_start):
-            put(y, x, "─")
-
-    # Attach leaf labels, aligned
-    leaf_by_y = {y: name for y, name in leaves}
-    for y in range(n_rows):
-        name = leaf_by_y.get(y, "")
-        # Ensure grid row is long enough to hold labels
-        if name:
-            if len(grid[y]) < label_start:
-                grid[y].extend([" "] * (label_start - len(grid[y])))
-            for i, ch in enumerate(name):
-                x = label_start + i
-                if x >= len(grid[y]):
-                    grid[y].append(ch)
-                else:
-                    grid[y][x] = ch
-
-    return "\n".join("".join(row).rstrip() for row in grid)
+    # Those cells are all blank, so a plain slice fill needs no merging.
+    for y, last in enumerate(leaf_last_x):
+        grid[y][last + 1:label_start] = _HORIZ_BYTE * (label_start - last - 1)
+
+    # Leaf labels are not written into the grid; each is appended to its row's
+    # glyphs at serialization time, starting at label_start. `leaves` is in row
+    # order with one leaf per row. Each row's glyphs end in the leaf's ─ run,
+    # so only the label can have trailing whitespace.
+    for y, name in leaves:
+        yield b"".join(map(GLYPH_BYTES.__getitem__, grid[y])) + name.rstrip().encode("utf-8")
 
 # def render_box_tree(root, node_map: Dict[int, NodeInfo], leaves: List[Tuple[int, str]]) -> str:
     # """
@@ -381,6 +515,118 @@ def render_box_tree(root, node_map: Dict[int, NodeInfo], leaves: List[Tuple[int,
     # return "\n".join("".join(row).rstrip() for row in grid)
 
 
+# ----------------------------
+# Render cache
+# ----------------------------
+
+# The render cache keeps at most this many entries; each new entry evicts the
+# least recently used ones beyond it (hits refresh an entry's mtime).
+CACHE_MAX_ENTRIES = 256
+
+# Temporary files older than this many seconds belong to runs that died before
+# renaming them into place, and are removed when the cache is pruned.
+CACHE_TMP_MAX_AGE = 24 * 60 * 60
+
+
+def _cache_path(args: argparse.Namespace) -> str:
+    """
+    Path of the cached rendering for this input file and these options, under
+    _cache_dir(). The key also covers this script's own source, so a changed
+    renderer never serves stale output.
+    """
+    h = hashlib.blake2b()
+    with open(args.newick, "rb") as f:
+        h.update(f.read())
+    h.update(repr(sorted(vars(args).items())).encode())
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    return os.path.join(_cache_dir(), h.hexdigest() + ".txt")
+
+
+def _cache_dir() -> str:
+    """$XDG_CACHE_HOME/termal, default ~/.cache/termal."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "termal")
+
+
+@contextlib.contextmanager
+def _cache_entry(path: Optional[str]) -> Iterator[Optional[Callable[[bytes], None]]]:
+    """
+    Yield a function that appends bytes to a new cache entry, or None if `path`
+    is None or the entry can't be created. The entry is written to a temporary
+    file, renamed into place only when the block completes, so concurrent runs
+    never see a partial entry. Cache I/O errors are ignored: after the first
+    one the entry is abandoned and further writes do nothing.
+    """
+    f = None
+    if path is not None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            f = os.fdopen(fd, "wb")
+        except OSError:
+            pass
+    if f is None:
+        yield None
+        return
+
+    failed = False
+
+    def write(data: bytes) -> None:
+        nonlocal failed
+        if not failed:
+            try:
+                f.write(data)
+            except OSError:
+                failed = True
+
+    try:
+        yield write
+    except BaseException:
+        _discard_cache_tmp(f, tmp)
+        raise
+    if failed:
+        _discard_cache_tmp(f, tmp)
+        return
+    try:
+        f.close()
+        os.replace(tmp, path)
+    except OSError:
+        _discard_cache_tmp(f, tmp)
+        return
+    _prune_cache(os.path.dirname(path))
+
+
+def _discard_cache_tmp(f: BinaryIO, tmp: str) -> None:
+    with contextlib.suppress(OSError):
+        f.close()
+    with contextlib.suppress(OSError):
+        os.unlink(tmp)
+
+
+def _prune_cache(cache_dir: str) -> None:
+    # Entries are never reused once the input, options or this script change,
+    # so bound the directory by evicting the least recently used ones, along
+    # with temporary files left behind by runs that were killed mid-write.
+    # Best-effort, like the rest of the cache.
+    now = time.time()
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for e in it:
+                with contextlib.suppress(OSError):
+                    if e.name.endswith(".txt"):
+                        entries.append((e.stat().st_mtime, e.path))
+                    elif e.name.endswith(".tmp") and now - e.stat().st_mtime > CACHE_TMP_MAX_AGE:
+                        os.unlink(e.path)
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, entry in entries[CACHE_MAX_ENTRIES:]:
+        with contextlib.suppress(OSError):
+            os.unlink(entry)
+
+
 # ----------------------------
 # CLI
 # ----------------------------
@@ -395,13 +641,32 @@ def main(argv: Optional[List[str]] = None) -> int:
     p.add_argument("--root", default=None,
                    help="Optional: root the tree at a named clade (exact match). "
                         "If omitted, uses the file's root as-is.")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Do not read or write the on-disk render cache "
+                        "($XDG_CACHE_HOME/termal, default ~/.cache/termal), which keeps "
+                        f"the {CACHE_MAX_ENTRIES} most recently used renderings.")
     args = p.parse_args(argv)
 
+    cache_path = None if args.no_cache else _cache_path(args)
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as f:
+                cached = f.read()
+        except OSError:
+            pass
+        else:
+            sys.stdout.buffer.write(cached)
+            # Mark the entry as recently used so pruning keeps it.
+            with contextlib.suppress(OSError):
+                os.utime(cache_path)
+            return 0
+
     tree = Phylo.read(args.newick, "newick")
     root = tree.root
 
+    collapsed: Set[int] = set()
     if not args.no_collapse_unary:
-        root = _collapse_unary(root)
+        root = _collapse_unary(root, collapsed)
 
     if args.root is not None:
         # Find the first clade with matching name and reroot there
@@ -412,14 +677,26 @@ def main(argv: Optional[List[str]] = None) -> int:
                 break
         if target is None:
             raise SystemExit(f"Could not find clade named '{args.root}' to root on.")
+        # Re-rooting only rewires the old root and the path down to the
+        # target; every other subtree is still collapsed.
+        for clade in [tree.root] + tree.get_path(target):
+            collapsed.discard(id(clade))
         tree.root_with_outgroup(target)
         root = tree.root
         if not args.no_collapse_unary:
-            root = _collapse_unary(root)
-
-    node_map, leaves = _assign_rows_and_depths(root)
-    out = render_box_tree(root, node_map, leaves)
-    sys.stdout.write(out + ("\n" if out and not out.endswith("\n") else ""))
+            root = _collapse_unary(root, collapsed)
+
+    flat, leaves = _assign_rows_and_depths(root)
+    # Stream rows straight to stdout's (buffered) byte stream rather than
+    # building the whole rendering as one string.
+    write = sys.stdout.buffer.write
+    with _cache_entry(cache_path) as cache_write:
+        for line in render_box_tree(flat, leaves):
+            write(line)
+            write(b"\n")
+            if cache_write is not None:
+                cache_write(line)
+                cache_write(b"\n")
     return 0
 
 
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+newick2box_bench.py
+
+Measure where newick2box.py's numba rasterizer starts to pay off, to set
+JIT_MIN_NODES. newick2box renders one tree per process, so the JIT path costs
+a fixed overhead (importing numpy + numba and loading the compiled _rasterize
+from numba's on-disk cache) that the pure-Python rasterizer never pays. This
+script measures that overhead in fresh processes, then times both rasterizers
+on balanced and caterpillar trees and reports the node count at which they
+break even. Rasterizing cost tracks the node count closely for both shapes;
+grid area (n_rows * label_col) does not, as caterpillar grids are mostly blank.
+
+Usage:
+  python newick2box_bench.py [--max-leaves N]
+
+Dependencies: biopython, numba (and numpy).
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Compile into a private numba cache, so the first overhead run below includes
+# the compile and the user's cache is left alone. Set before numba is first
+# imported (by this process or the subprocesses, which inherit it).
+CACHE_DIR = tempfile.mkdtemp(prefix="newick2box-bench-")
+os.environ["NUMBA_CACHE_DIR"] = CACHE_DIR
+
+_spec = importlib.util.spec_from_file_location("newick2box", os.path.join(HERE, "newick2box.py"))
+n2b = importlib.util.module_from_spec(_spec)
+sys.modules["newick2box"] = n2b
+_spec.loader.exec_module(n2b)
+
+from Bio import Phylo  # noqa: E402  (newick2box already requires it)
+
+# Run in a fresh interpreter: lay out a two-leaf tree, then time the JIT
+# rasterizer on it, which imports numpy/numba and loads the cached _rasterize.
+# Prints the elapsed seconds.
+_OVERHEAD_SNIPPET = """
+import importlib.util, io, sys, time
+spec = importlib.util.spec_from_file_location("newick2box", sys.argv[1])
+m = sys.modules["newick2box"] = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+tree, _ = m._assign_rows_and_depths(m.Phylo.read(io.StringIO("(A,B);"), "newick").root)
+t = time.perf_counter()
+m._rasterize_grid(tree, tree.max_depth * 2 + 2, True)
+print(time.perf_counter() - t)
+"""
+
+
+def _balanced(n_leaves: int, rng: random.Random) -> str:
+    names = [f"L{i}" for i in range(n_leaves)]
+    while len(names) > 1:
+        i = rng.randrange(len(names) - 1)
+        names[i:i + 2] = [f"({names[i]},{names[i + 1]})"]
+    return names[0] + ";"
+
+
+def _caterpillar(n_leaves: int) -> str:
+    s = "L0"
+    for i in range(1, n_leaves):
+        s = f"({s},L{i})"
+    return s + ";"
+
+
+def _layout(newick: str):
+    root = n2b._collapse_unary(Phylo.read(io.StringIO(newick), "newick").root)
+    tree, _ = n2b._assign_rows_and_depths(root)
+    return tree, tree.max_depth * 2 + 2
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def _measure(max_leaves: int) -> None:
+    # Fixed cost per process. The first run may also compile and fill numba's cache.
+    script = os.path.join(HERE, "newick2box.py")
+    runs = [float(subprocess.check_output([sys.executable, "-c", _OVERHEAD_SNIPPET, script]))
+            for _ in range(6)]
+    overhead = min(runs[1:])
+    print(f"JIT fixed overhead per process: {overhead * 1000:.0f} ms "
+          f"(first run, incl. any compile: {runs[0] * 1000:.0f} ms)\n")
+
+    rng = random.Random(1)
+    cases = []
+    n = 500
+    while n <= max_leaves:
+        cases.append((f"balanced {n}", _balanced(n, rng)))
+        n *= 2
+    for n in (500, 1000, 2000, 3000):
+        cases.append((f"caterpillar {n}", _caterpillar(n)))
+
+    print(f"{'tree':<18}{'nodes':>9}{'cells':>14}{'python ms':>12}{'jit ms':>10}{'saved us/node':>15}")
+    us_per_node = []
+    for name, newick in cases:
+        tree, label_col = _layout(newick)
+        nodes = len(tree.first_child)
+        cells = tree.n_rows * label_col
+        t_py = _best(lambda: n2b._rasterize_grid(tree, label_col, False), 3)
+        t_jit = _best(lambda: n2b._rasterize_grid(tree, label_col, True), 3)
+        us_per_node.append((t_py - t_jit) / nodes * 1e6)
+        print(f"{name:<18}{nodes:>9,}{cells:>14,}{t_py * 1000:>12.1f}{t_jit * 1000:>10.1f}"
+              f"{us_per_node[-1]:>15.2f}")
+
+    # Use the smallest per-node saving seen, so the JIT is a win on every shape
+    # once the tree is past the threshold.
+    saving = min(us_per_node)
+    if saving <= 0:
+        print(f"\nNo break-even: the JIT was slower on at least one tree ({saving:.2f} us/node); "
+              "rerun on a quieter machine.")
+        return
+    print(f"\nBreak-even tree size: {overhead / (saving * 1e-6):,.0f} nodes "
+          f"(overhead / smallest per-node saving of {saving:.2f} us)")
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Derive newick2box's JIT_MIN_NODES threshold.")
+    p.add_argument("--max-leaves", type=int, default=128000,
+                   help="Largest balanced tree to time (caterpillars stop at 3000 leaves).")
+    args = p.parse_args()
+
+    if n2b._load_rasterize_jit() is None:
+        raise SystemExit("numba is not installed; nothing to compare.")
+    try:
+        _measure(args.max_leaves)
+    finally:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())